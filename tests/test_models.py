@@ -39,7 +39,7 @@ np.random.seed(0)
 
 
 def test_mlp():
-    input = T.Tensor([1, 1])
+    input = T.tensor([1, 1], dtype=T.float32)
     model = MLP([2, 1])
     output = model(input)
     assert output.shape == (1,)
@@ -47,26 +47,24 @@ def test_mlp():
 
 @pytest.mark.parametrize("encoder_class", [IdentityEncoder, FlattenEncoder, MLPEncoder])
 def test_encoder(encoder_class):
-    input = T.Tensor([[2, 2], [1, 1]])
+    input = T.tensor([[2, 2], [1, 1]], dtype=T.float32)
     if encoder_class == MLPEncoder:
         encoder = encoder_class(input_size=2, output_size=2)
-    elif encoder_class == DictEncoder:
-        encoder = encoder_class(labels=["observation"])
     else:
         encoder = encoder_class()
     output = encoder(input)
     if isinstance(encoder, (IdentityEncoder)):
         assert T.equal(input, output)
     elif isinstance(encoder, (FlattenEncoder)):
-        assert T.equal(output, T.Tensor([2, 2, 1, 1]))
+        assert T.equal(output, T.tensor([2, 2, 1, 1], dtype=T.float32))
     else:
         assert len(output.shape) == 2
 
 
 def test_dict_encoder():
     input = {
-        "observation": T.Tensor([[2, 2], [1, 1]]),
-        "action": T.Tensor([[1, 1], [2, 2]]),
+        "observation": T.tensor([[2, 2], [1, 1]], dtype=T.float32),
+        "action": T.tensor([[1, 1], [2, 2]], dtype=T.float32),
     }
     encoder = DictEncoder(labels=["observation", "action"])
     actual_output = encoder(input)
@@ -84,14 +82,41 @@ def test_cnn_encoder():
     assert output.shape == (1, 512)
 
 
+@pytest.mark.parametrize(
+    "head_class",
+    [
+        ValueHead,
+        ContinuousQHead,
+        DiscreteQHead,
+        DeterministicHead,
+        CategoricalHead,
+        DiagGaussianHead,
+    ],
+)
+def test_head_input_shape_normalization(head_class):
+    if head_class == DiscreteQHead:
+        kwargs = {"output_shape": (2,)}
+    elif head_class == DeterministicHead:
+        kwargs = {"action_shape": 2}
+    elif head_class in (CategoricalHead, DiagGaussianHead):
+        kwargs = {"action_size": 2}
+    else:
+        kwargs = {}
+    int_head = head_class(input_shape=5, **kwargs)
+    tuple_head = head_class(input_shape=(5,), **kwargs)
+
+    int_shapes = [param.shape for param in int_head.parameters()]
+    tuple_shapes = [param.shape for param in tuple_head.parameters()]
+    assert int_shapes == tuple_shapes
+
+
 @pytest.mark.parametrize("head_class", [ValueHead, ContinuousQHead, DiscreteQHead])
-@pytest.mark.parametrize("input_shape", [5, (5,)])
-def test_critic_head(head_class, input_shape):
-    input = T.Tensor([1, 1, 1, 1, 1])
+def test_critic_head(head_class):
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
     if head_class == DiscreteQHead:
-        head = head_class(input_shape=input_shape, output_shape=(2,))
+        head = head_class(input_shape=(5,), output_shape=(2,))
     else:
-        head = head_class(input_shape=input_shape)
+        head = head_class(input_shape=(5,))
 
     output = head(input)
 
@@ -104,13 +129,12 @@ def test_critic_head(head_class, input_shape):
 @pytest.mark.parametrize(
     "head_class", [DeterministicHead, CategoricalHead, DiagGaussianHead]
 )
-@pytest.mark.parametrize("input_shape", [5, (5,)])
-def test_actor_head(head_class, input_shape):
-    input = T.Tensor([1, 1, 1, 1, 1])
+def test_actor_head(head_class):
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
     if head_class == DeterministicHead:
-        head = head_class(input_shape, action_shape=2)
+        head = head_class((5,), action_shape=2)
     else:
-        head = head_class(input_shape=input_shape, action_size=2)
+        head = head_class(input_shape=(5,), action_size=2)
 
     output = head(input)
 
@@ -122,7 +146,7 @@ def test_actor_head(head_class, input_shape):
 
 @pytest.mark.parametrize("head_class", [BoxHead, DiscreteHead, MultiDiscreteHead])
 def test_env_head(head_class):
-    input = T.Tensor([1, 1, 1, 1, 1])
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
 
     # Test 1: BoxHead
     if head_class == BoxHead:
@@ -156,7 +180,7 @@ def test_env_head(head_class):
 
 
 def test_critic():
-    input = T.Tensor([1, 1, 1, 1, 1])
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
     encoder = IdentityEncoder()
     torso = MLP([5, 5])
     head = ValueHead(input_shape=5)
@@ -196,7 +220,7 @@ def test_critic():
 
 
 def test_actor():
-    input = T.Tensor([1, 1, 1, 1, 1])
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
     encoder = IdentityEncoder()
     torso = MLP([5, 5])
     head = DeterministicHead(input_shape=5, action_shape=1)
@@ -238,7 +262,7 @@ def test_actor():
 @pytest.mark.parametrize("actor_population_size", [1, 2])
 @pytest.mark.parametrize("critic_population_size", [1, 2])
 def test_actor_critic(actor_population_size, critic_population_size):
-    input = T.Tensor([1, 1, 1, 1, 1])
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
     x_actor = input.repeat(actor_population_size, 1)
     x_critic = input.repeat(critic_population_size, 1)
     encoder_actor = IdentityEncoder()
@@ -392,7 +416,7 @@ def test_shared_network():
 @pytest.mark.parametrize("actor_population_size", [1, 2])
 @pytest.mark.parametrize("critic_population_size", [1, 2])
 def test_actor_critic_targets(actor_population_size, critic_population_size):
-    input = T.Tensor([1, 1, 1, 1, 1])
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32)
     x_actor = input.repeat(actor_population_size, 1)
     x_critic = input.repeat(critic_population_size, 1)
     encoder_actor = IdentityEncoder()
@@ -473,7 +497,7 @@ def test_population_initialize():
 
 @pytest.mark.parametrize("actor_population_size", [1, 2])
 def test_action_distribution(actor_population_size):
-    input = T.Tensor([1, 1, 1, 1, 1]).repeat(actor_population_size, 1)
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32).repeat(actor_population_size, 1)
     encoder_actor = IdentityEncoder()
     encoder_critic = IdentityEncoder()
     torso_actor = MLP([5, 5])
@@ -493,11 +517,11 @@ def test_action_distribution(actor_population_size):
     )
 
     distribution = model.action_distribution(input)
-    global_dist = model.predict_distribution(T.Tensor([1, 1, 1, 1, 1]))
+    global_dist = model.predict_distribution(T.tensor([1, 1, 1, 1, 1], dtype=T.float32))
     assert distribution is None
     assert global_dist is None
 
-    input = T.Tensor([1, 1, 1, 1, 1]).repeat(actor_population_size, 1)
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32).repeat(actor_population_size, 1)
     head_actor = CategoricalHead(input_shape=5, action_size=5)
 
     actor = Actor(encoder_actor, torso_actor, head_actor)
@@ -512,12 +536,12 @@ def test_action_distribution(actor_population_size):
     )
 
     distribution = model.action_distribution(input)
-    global_dist = model.predict_distribution(T.Tensor([1, 1, 1, 1, 1]))
+    global_dist = model.predict_distribution(T.tensor([1, 1, 1, 1, 1], dtype=T.float32))
     assert isinstance(distribution, T.distributions.Categorical)
     assert distribution.logits.shape == (actor_population_size, 5)
     assert global_dist.logits.shape == (5,)
 
-    input = T.Tensor([1, 1, 1, 1, 1]).repeat(actor_population_size, 1)
+    input = T.tensor([1, 1, 1, 1, 1], dtype=T.float32).repeat(actor_population_size, 1)
     head_actor = DiagGaussianHead(input_shape=5, action_size=5)
 
     actor = Actor(encoder_actor, torso_actor, head_actor)
@@ -532,7 +556,7 @@ def test_action_distribution(actor_population_size):
     )
 
     distribution = model.action_distribution(input)
-    global_dist = model.predict_distribution(T.Tensor([1, 1, 1, 1, 1]))
+    global_dist = model.predict_distribution(T.tensor([1, 1, 1, 1, 1], dtype=T.float32))
     assert isinstance(distribution, T.distributions.Normal)
     assert distribution.loc.shape == (actor_population_size, 5)
     assert distribution.scale.shape == (actor_population_size, 5)
@@ -1,5 +1,5 @@
 import copy
-from typing import Union
+import os
 
 import gym
 import numpy as np
@@ -33,58 +33,173 @@ from pearll.updaters.evolution import GeneticUpdater, NoisyGradientAscent
 
 ############################### SET UP MODELS ###############################
 
-encoder_critic = IdentityEncoder()
-encoder_critic_continuous = MLPEncoder(input_size=3, output_size=2)
-encoder_actor = IdentityEncoder()
-torso_critic = MLP(layer_sizes=[2, 2])
-torso_actor = MLP(layer_sizes=[2, 2])
-head_actor = DiagGaussianHead(input_shape=2, action_size=1)
-head_critic = ValueHead(input_shape=2, activation_fn=None)
-
-actor = Actor(encoder=encoder_actor, torso=torso_actor, head=head_actor)
-critic = Critic(encoder=encoder_critic, torso=torso_critic, head=head_critic)
-continuous_critic = Critic(
-    encoder=encoder_critic_continuous, torso=torso_critic, head=head_critic
-)
-continuous_critic_shared = Critic(
-    encoder=encoder_critic_continuous, torso=torso_actor, head=head_critic
-)
-critic_shared = Critic(encoder=encoder_actor, torso=torso_actor, head=head_critic)
 
-actor_critic = ActorCritic(actor=actor, critic=critic)
-actor_critic_shared = ActorCritic(actor=actor, critic=critic_shared)
-continuous_actor_critic = ActorCritic(actor=actor, critic=continuous_critic)
-continuous_actor_critic_shared = ActorCritic(
-    actor=actor, critic=continuous_critic_shared
-)
-marl = ActorCritic(
-    actor=actor,
-    critic=critic,
-    population_settings=PopulationSettings(
-        actor_population_size=2, critic_population_size=2
-    ),
-)
-marl_shared = ActorCritic(
-    actor=actor,
-    critic=critic_shared,
-    population_settings=PopulationSettings(
-        actor_population_size=2, critic_population_size=2
-    ),
-)
-marl_continuous = ActorCritic(
-    actor=actor,
-    critic=continuous_critic,
-    population_settings=PopulationSettings(
-        actor_population_size=2, critic_population_size=2
-    ),
-)
-marl_shared_continuous = ActorCritic(
-    actor=actor,
-    critic=continuous_critic_shared,
-    population_settings=PopulationSettings(
-        actor_population_size=2, critic_population_size=2
-    ),
-)
+@pytest.fixture
+def encoder_critic():
+    return IdentityEncoder()
+
+
+@pytest.fixture
+def encoder_critic_continuous():
+    return MLPEncoder(input_size=3, output_size=2)
+
+
+@pytest.fixture
+def encoder_actor():
+    return IdentityEncoder()
+
+
+@pytest.fixture
+def torso_critic():
+    return MLP(layer_sizes=[2, 2])
+
+
+@pytest.fixture
+def torso_actor():
+    return MLP(layer_sizes=[2, 2])
+
+
+@pytest.fixture
+def head_actor():
+    return DiagGaussianHead(input_shape=2, action_size=1)
+
+
+@pytest.fixture
+def head_critic():
+    return ValueHead(input_shape=2, activation_fn=None)
+
+
+@pytest.fixture
+def actor(encoder_actor, torso_actor, head_actor):
+    return Actor(encoder=encoder_actor, torso=torso_actor, head=head_actor)
+
+
+@pytest.fixture
+def critic(encoder_critic, torso_critic, head_critic):
+    return Critic(encoder=encoder_critic, torso=torso_critic, head=head_critic)
+
+
+@pytest.fixture
+def continuous_critic(encoder_critic_continuous, torso_critic, head_critic):
+    return Critic(
+        encoder=encoder_critic_continuous, torso=torso_critic, head=head_critic
+    )
+
+
+@pytest.fixture
+def continuous_critic_shared(encoder_critic_continuous, torso_actor, head_critic):
+    return Critic(
+        encoder=encoder_critic_continuous, torso=torso_actor, head=head_critic
+    )
+
+
+@pytest.fixture
+def critic_shared(encoder_actor, torso_actor, head_critic):
+    return Critic(encoder=encoder_actor, torso=torso_actor, head=head_critic)
+
+
+@pytest.fixture
+def actor_critic(actor, critic):
+    return ActorCritic(actor=actor, critic=critic)
+
+
+@pytest.fixture
+def actor_critic_shared(actor, critic_shared):
+    return ActorCritic(actor=actor, critic=critic_shared)
+
+
+@pytest.fixture
+def continuous_actor_critic(actor, continuous_critic):
+    return ActorCritic(actor=actor, critic=continuous_critic)
+
+
+@pytest.fixture
+def continuous_actor_critic_shared(actor, continuous_critic_shared):
+    return ActorCritic(actor=actor, critic=continuous_critic_shared)
+
+
+@pytest.fixture
+def marl(actor, critic):
+    return ActorCritic(
+        actor=actor,
+        critic=critic,
+        population_settings=PopulationSettings(
+            actor_population_size=2, critic_population_size=2
+        ),
+    )
+
+
+@pytest.fixture
+def marl_shared(actor, critic_shared):
+    return ActorCritic(
+        actor=actor,
+        critic=critic_shared,
+        population_settings=PopulationSettings(
+            actor_population_size=2, critic_population_size=2
+        ),
+    )
+
+
+@pytest.fixture
+def marl_continuous(actor, continuous_critic):
+    return ActorCritic(
+        actor=actor,
+        critic=continuous_critic,
+        population_settings=PopulationSettings(
+            actor_population_size=2, critic_population_size=2
+        ),
+    )
+
+
+@pytest.fixture
+def marl_shared_continuous(actor, continuous_critic_shared):
+    return ActorCritic(
+        actor=actor,
+        critic=continuous_critic_shared,
+        population_settings=PopulationSettings(
+            actor_population_size=2, critic_population_size=2
+        ),
+    )
+
+
+############################### SET UP INPUTS ###############################
+
+
+@pytest.fixture(scope="module")
+def observation():
+    return T.rand(2)
+
+
+@pytest.fixture(scope="module")
+def action():
+    return T.rand(1)
+
+
+@pytest.fixture(scope="module")
+def advantage():
+    return T.rand(1)
+
+
+@pytest.fixture(scope="module")
+def old_log_prob():
+    return T.rand(1)
+
+
+@pytest.fixture(scope="module")
+def returns():
+    return T.rand(1)
+
+
+############################### SET UP UPDATERS ###############################
+
+# The actor and critic updaters only hold hyperparameters so can be shared across tests
+POLICY_GRADIENT = PolicyGradient(max_grad=0.5)
+PROXIMAL_POLICY_CLIP = ProximalPolicyClip(max_grad=0.5)
+DETERMINISTIC_POLICY_GRADIENT = DeterministicPolicyGradient(max_grad=0.5)
+SOFT_POLICY_GRADIENT = SoftPolicyGradient(max_grad=0.5)
+VALUE_REGRESSION = ValueRegression(max_grad=0.5)
+DISCRETE_Q_REGRESSION = DiscreteQRegression(max_grad=0.5)
+CONTINUOUS_Q_REGRESSION = ContinuousQRegression(max_grad=0.5)
 
 T.manual_seed(0)
 np.random.seed(0)
@@ -100,134 +215,147 @@ def same_distribution(
 
 
 @pytest.mark.parametrize(
-    "model", [actor, actor_critic, actor_critic_shared, marl, marl_shared]
+    "model_name",
+    ["actor", "actor_critic", "actor_critic_shared", "marl", "marl_shared"],
 )
-def test_policy_gradient(model: Union[Actor, ActorCritic]):
-    observation = T.rand(2)
-    if model != actor:
-        with T.no_grad():
-            observation = observation.repeat(model.num_actors, 1)
+def test_policy_gradient(
+    model_name: str,
+    request: pytest.FixtureRequest,
+    observation: T.Tensor,
+    action: T.Tensor,
+    advantage: T.Tensor,
+):
+    model = request.getfixturevalue(model_name)
+    if model_name != "actor":
+        observation = observation.repeat(model.num_actors, 1)
+        with T.inference_mode():
             critic_before = model.forward_critics(observation)
     out_before = model.action_distribution(observation)
 
-    updater = PolicyGradient(max_grad=0.5)
-
-    updater(
+    POLICY_GRADIENT(
         model=model,
         observations=observation,
-        actions=T.rand(1),
-        advantages=T.rand(1),
+        actions=action,
+        advantages=advantage,
     )
 
     out_after = model.action_distribution(observation)
-    if model != actor:
-        with T.no_grad():
+    if model_name != "actor":
+        with T.inference_mode():
             critic_after = model.forward_critics(observation)
 
     assert not same_distribution(out_after, out_before)
-    if model == actor_critic or model == marl:
+    if model_name in ("actor_critic", "marl"):
         assert T.equal(critic_before, critic_after)
-    if model == actor_critic_shared or model == marl_shared:
+    if model_name in ("actor_critic_shared", "marl_shared"):
         assert not T.equal(critic_before, critic_after)
 
 
 @pytest.mark.parametrize(
-    "model", [actor, actor_critic, actor_critic_shared, marl, marl_shared]
+    "model_name",
+    ["actor", "actor_critic", "actor_critic_shared", "marl", "marl_shared"],
 )
-def test_proximal_policy_clip(model: Union[Actor, ActorCritic]):
-    observation = T.rand(2)
-    if model != actor:
-        with T.no_grad():
-            observation = observation.repeat(model.num_actors, 1)
+def test_proximal_policy_clip(
+    model_name: str,
+    request: pytest.FixtureRequest,
+    observation: T.Tensor,
+    action: T.Tensor,
+    advantage: T.Tensor,
+    old_log_prob: T.Tensor,
+):
+    model = request.getfixturevalue(model_name)
+    if model_name != "actor":
+        observation = observation.repeat(model.num_actors, 1)
+        with T.inference_mode():
             critic_before = model.forward_critics(observation)
     out_before = model.action_distribution(observation)
 
-    updater = ProximalPolicyClip(max_grad=0.5)
-
-    updater(
+    PROXIMAL_POLICY_CLIP(
         model=model,
         observations=observation,
-        actions=T.rand(1),
-        advantages=T.rand(1),
-        old_log_probs=T.rand(1),
+        actions=action,
+        advantages=advantage,
+        old_log_probs=old_log_prob,
     )
 
     out_after = model.action_distribution(observation)
-    if model != actor:
-        with T.no_grad():
+    if model_name != "actor":
+        with T.inference_mode():
             critic_after = model.forward_critics(observation)
 
     assert not same_distribution(out_after, out_before)
-    if model == actor_critic or model == marl:
+    if model_name in ("actor_critic", "marl"):
         assert T.equal(critic_before, critic_after)
-    if model == actor_critic_shared or model == marl_shared:
+    if model_name in ("actor_critic_shared", "marl_shared"):
         assert not T.equal(critic_before, critic_after)
 
 
 @pytest.mark.parametrize(
-    "model",
+    "model_name",
     [
-        continuous_actor_critic,
-        continuous_actor_critic_shared,
-        marl_continuous,
-        marl_shared_continuous,
+        "continuous_actor_critic",
+        "continuous_actor_critic_shared",
+        "marl_continuous",
+        "marl_shared_continuous",
     ],
 )
-def test_deterministic_policy_gradient(model: ActorCritic):
-    observation = T.rand(2).repeat(model.num_actors, 1)
+def test_deterministic_policy_gradient(
+    model_name: str, request: pytest.FixtureRequest, observation: T.Tensor
+):
+    model = request.getfixturevalue(model_name)
+    observation = observation.repeat(model.num_actors, 1)
     action = model(observation)
-    with T.no_grad():
+    with T.inference_mode():
         critic_before = model.forward_critics(observation, action)
 
-    updater = DeterministicPolicyGradient(max_grad=0.5)
-
-    updater(
+    DETERMINISTIC_POLICY_GRADIENT(
         model=model,
         observations=observation,
     )
 
     out_after = model(observation)
-    with T.no_grad():
+    with T.inference_mode():
         critic_after = model.forward_critics(observation, action)
 
     assert not T.equal(action, out_after)
-    if model == continuous_actor_critic or model == marl_continuous:
+    if model_name in ("continuous_actor_critic", "marl_continuous"):
         assert T.equal(critic_before, critic_after)
-    if model == continuous_actor_critic_shared or model == marl_shared_continuous:
+    if model_name in ("continuous_actor_critic_shared", "marl_shared_continuous"):
         assert not T.equal(critic_before, critic_after)
 
 
 @pytest.mark.parametrize(
-    "model",
+    "model_name",
     [
-        continuous_actor_critic,
-        continuous_actor_critic_shared,
-        marl_continuous,
-        marl_shared_continuous,
+        "continuous_actor_critic",
+        "continuous_actor_critic_shared",
+        "marl_continuous",
+        "marl_shared_continuous",
     ],
 )
-def test_soft_policy_gradient(model: ActorCritic):
-    observation = T.rand(2).repeat(model.num_actors, 1)
+def test_soft_policy_gradient(
+    model_name: str, request: pytest.FixtureRequest, observation: T.Tensor
+):
+    model = request.getfixturevalue(model_name)
+    observation = observation.repeat(model.num_actors, 1)
     action = model(observation)
     out_before = model.action_distribution(observation)
-    with T.no_grad():
+    with T.inference_mode():
         critic_before = model.forward_critics(observation, action)
 
-    updater = SoftPolicyGradient(max_grad=0.5)
-
-    updater(
+    SOFT_POLICY_GRADIENT(
         model=model,
         observations=observation,
     )
 
     out_after = model.action_distribution(observation)
-    with T.no_grad():
+    with T.inference_mode():
         critic_after = model.forward_critics(observation, action)
 
     assert not same_distribution(out_after, out_before)
-    if model == continuous_actor_critic or model == marl_continuous:
+    if model_name in ("continuous_actor_critic", "marl_continuous"):
         assert T.equal(critic_before, critic_after)
-    if model == continuous_actor_critic_shared or model == marl_shared_continuous:
+    if model_name in ("continuous_actor_critic_shared", "marl_shared_continuous"):
         assert not T.equal(critic_before, critic_after)
 
 
@@ -235,145 +363,160 @@ def test_soft_policy_gradient(model: ActorCritic):
 
 
 @pytest.mark.parametrize(
-    "model", [critic, actor_critic, actor_critic_shared, marl, marl_shared]
+    "model_name",
+    ["critic", "actor_critic", "actor_critic_shared", "marl", "marl_shared"],
 )
-def test_value_regression(model: Union[Critic, ActorCritic]):
-    observation = T.rand(2)
-    returns = T.rand(1)
-    if model != critic:
+def test_value_regression(
+    model_name: str,
+    request: pytest.FixtureRequest,
+    observation: T.Tensor,
+    returns: T.Tensor,
+):
+    model = request.getfixturevalue(model_name)
+    if model_name != "critic":
         observation = observation.repeat(model.num_critics, 1)
-        with T.no_grad():
+        with T.inference_mode():
             actor_before = model.action_distribution(observation)
         out_before = model.forward_critics(observation)
     else:
         out_before = model(observation)
 
-    updater = ValueRegression(max_grad=0.5)
-
-    updater(model, observation, returns)
+    VALUE_REGRESSION(model, observation, returns)
 
-    if model != critic:
+    if model_name != "critic":
         out_after = model.forward_critics(observation)
-        with T.no_grad():
+        with T.inference_mode():
             actor_after = model.action_distribution(observation)
     else:
         out_after = model(observation)
 
     assert not T.equal(out_after, out_before)
-    if model == actor_critic_shared or model == marl_shared:
+    if model_name in ("actor_critic_shared", "marl_shared"):
         assert not same_distribution(actor_before, actor_after)
-    elif model == actor_critic or model == marl:
+    elif model_name in ("actor_critic", "marl"):
         assert same_distribution(actor_before, actor_after)
 
 
-@pytest.mark.parametrize("model", [critic, actor_critic, actor_critic_shared])
-def test_discrete_q_regression(model: Union[Critic, ActorCritic]):
-    observation = T.rand(1, 2)
+@pytest.mark.parametrize(
+    "model_name", ["critic", "actor_critic", "actor_critic_shared"]
+)
+def test_discrete_q_regression(
+    model_name: str,
+    request: pytest.FixtureRequest,
+    observation: T.Tensor,
+    returns: T.Tensor,
+):
+    model = request.getfixturevalue(model_name)
+    observation = observation.unsqueeze(0)
     actions = T.randint(0, 1, (1, 1))
-    returns = T.rand(1)
-    if model == critic:
+    if model_name == "critic":
         out_before = model(observation)
     else:
         out_before = model.forward_critics(observation)
-        with T.no_grad():
+        with T.inference_mode():
             actor_before = model.action_distribution(observation)
 
-    updater = DiscreteQRegression(max_grad=0.5)
-
-    updater(model, observation, returns, actions)
+    DISCRETE_Q_REGRESSION(model, observation, returns, actions)
 
-    if model == critic:
+    if model_name == "critic":
         out_after = model(observation)
     else:
         out_after = model.forward_critics(observation)
-        with T.no_grad():
+        with T.inference_mode():
             actor_after = model.action_distribution(observation)
 
     assert not T.equal(out_before, out_after)
-    if model == actor_critic_shared:
+    if model_name == "actor_critic_shared":
         assert not same_distribution(actor_before, actor_after)
-    elif model == actor_critic:
+    elif model_name == "actor_critic":
         assert same_distribution(actor_before, actor_after)
 
 
 @pytest.mark.parametrize(
-    "model",
-    [continuous_actor_critic, continuous_actor_critic_shared, continuous_critic],
+    "model_name",
+    ["continuous_actor_critic", "continuous_actor_critic_shared", "continuous_critic"],
 )
-def test_continuous_q_regression(model: Union[Critic, ActorCritic]):
-    observation = T.rand(1, 2)
-    actions = T.rand(1, 1)
-    returns = T.rand(1)
-    if model == continuous_critic:
+def test_continuous_q_regression(
+    model_name: str,
+    request: pytest.FixtureRequest,
+    observation: T.Tensor,
+    action: T.Tensor,
+    returns: T.Tensor,
+):
+    model = request.getfixturevalue(model_name)
+    observation = observation.unsqueeze(0)
+    actions = action.unsqueeze(0)
+    if model_name == "continuous_critic":
         out_before = model(observation, actions)
     else:
         out_before = model.forward_critics(observation, actions)
-        with T.no_grad():
+        with T.inference_mode():
             actor_before = model.action_distribution(observation)
 
-    updater = ContinuousQRegression(max_grad=0.5)
+    CONTINUOUS_Q_REGRESSION(model, observation, actions, returns)
 
-    updater(model, observation, actions, returns)
-
-    if model == continuous_critic:
+    if model_name == "continuous_critic":
         out_after = model(observation, actions)
     else:
         out_after = model.forward_critics(observation, actions)
-        with T.no_grad():
+        with T.inference_mode():
             actor_after = model.action_distribution(observation)
 
     assert out_after != out_before
-    if model == continuous_actor_critic_shared:
+    if model_name == "continuous_actor_critic_shared":
         assert not same_distribution(actor_before, actor_after)
-    elif model == continuous_actor_critic:
+    elif model_name == "continuous_actor_critic":
         assert same_distribution(actor_before, actor_after)
 
 
 ############################### TEST EVOLUTION UPDATERS ###############################
 
 
-class Sphere(gym.Env):
+class VectorSphere:
     """
-    Sphere(2) function for testing ES agent.
+    Vectorized Sphere(n) function for testing ES and GA agents.
+    Scores the whole population in one NumPy call, mimicking only the parts
+    of the gym vector env API the tests use.
+
+    :param action_space: the action space of a single population member
     """
 
-    def __init__(self):
-        self.action_space = gym.spaces.Box(low=-100, high=100, shape=(2,))
-        self.observation_space = gym.spaces.Discrete(1)
+    def __init__(self, action_space: gym.Space) -> None:
+        self.single_action_space = action_space
 
-    def step(self, action):
-        return 0, -(action[0] ** 2 + action[1] ** 2), False, {}
+    def step(self, actions):
+        actions = np.asarray(actions, dtype=np.float64)
+        return None, -np.einsum("ij,ij->i", actions, actions), None, None
 
-    def reset(self):
-        return 0
 
+POPULATION_SIZE = int(os.environ.get("PEARLL_TEST_POPULATION_SIZE", "100"))
+# Only large populations (e.g. the nightly run) are slow enough to deselect by default
+slow_population = (
+    pytest.mark.slow if POPULATION_SIZE > 1000 else pytest.mark.usefixtures()
+)
 
-class DiscreteSphere(gym.Env):
-    """
-    Discrete Sphere(1) function for testing ES agent.
-    """
 
-    def __init__(self):
-        self.action_space = gym.spaces.Discrete(10)
-        self.observation_space = gym.spaces.Discrete(1)
+@pytest.fixture
+def numpy_seed():
+    # Seed per test so results don't depend on test order, then restore the global state
+    state = np.random.get_state()
+    np.random.seed(0)
+    yield
+    np.random.set_state(state)
 
-    def step(self, action):
-        return 0, -(action ** 2), False, {}
 
-    def reset(self):
-        return 0
+@pytest.fixture(scope="session")
+def env_continuous():
+    return VectorSphere(gym.spaces.Box(low=-100, high=100, shape=(2,)))
 
 
-POPULATION_SIZE = 100
-env_continuous = gym.vector.SyncVectorEnv(
-    [lambda: Sphere() for _ in range(POPULATION_SIZE)]
-)
-env_discrete = gym.vector.SyncVectorEnv(
-    [lambda: DiscreteSphere() for _ in range(POPULATION_SIZE)]
-)
+@pytest.fixture(scope="session")
+def env_discrete():
+    return VectorSphere(gym.spaces.Discrete(10))
 
 
-def test_evolutionary_updater_continuous():
+@slow_population
+def test_evolutionary_updater_continuous(env_continuous, numpy_seed):
     actor_continuous = Dummy(
         space=env_continuous.single_action_space, state=np.array([10, 10])
     )
@@ -398,8 +541,9 @@ def test_evolutionary_updater_continuous():
     old_population = model_continuous.numpy_actors()
     action = model_continuous(np.zeros(POPULATION_SIZE))
     _, rewards, _, _ = env_continuous.step(action)
-    scaled_rewards = (rewards - np.mean(rewards)) / np.std(rewards)
-    optimization_direction = np.dot(updater.normal_dist.T, scaled_rewards)
+    scaled_rewards = rewards - rewards.mean()
+    scaled_rewards /= scaled_rewards.std()
+    optimization_direction = updater.normal_dist.T @ scaled_rewards
     log = updater(learning_rate=0.01, optimization_direction=optimization_direction)
     new_population = model_continuous.numpy_actors()
     assert log.divergence > 0
@@ -418,7 +562,8 @@ def test_evolutionary_updater_continuous():
     )
 
 
-def test_evolutionary_updater_discrete():
+@slow_population
+def test_evolutionary_updater_discrete(env_discrete, numpy_seed):
     actor_discrete = Dummy(space=env_discrete.single_action_space, state=np.array([5]))
     critic = Dummy(space=env_discrete.single_action_space)
     model_discrete = ActorCritic(
@@ -443,8 +588,9 @@ def test_evolutionary_updater_discrete():
     old_population = model_discrete.numpy_actors()
     action = model_discrete(np.zeros(POPULATION_SIZE))
     _, rewards, _, _ = env_discrete.step(action)
-    scaled_rewards = (rewards - np.mean(rewards)) / np.std(rewards)
-    optimization_direction = np.dot(updater.normal_dist.T, scaled_rewards)
+    scaled_rewards = rewards - rewards.mean()
+    scaled_rewards /= scaled_rewards.std()
+    optimization_direction = updater.normal_dist.T @ scaled_rewards
     log = updater(learning_rate=1e-5, optimization_direction=optimization_direction)
     new_population = model_discrete.numpy_actors()
     assert log.divergence > 0
@@ -461,7 +607,8 @@ def test_evolutionary_updater_discrete():
     np.testing.assert_array_less(model_discrete.mean_actor, np.array([5]))
 
 
-def test_genetic_updater_continuous():
+@slow_population
+def test_genetic_updater_continuous(env_continuous, numpy_seed):
     actor_continuous = Dummy(
         space=env_continuous.single_action_space, state=np.array([10, 10])
     )
@@ -498,7 +645,8 @@ def test_genetic_updater_continuous():
     np.testing.assert_array_less(np.min(new_population, axis=0), np.array([10, 10]))
 
 
-def test_genetic_updater_discrete():
+@slow_population
+def test_genetic_updater_discrete(env_discrete, numpy_seed):
     actor_discrete = Dummy(space=env_discrete.single_action_space, state=np.array([5]))
     critic = Dummy(space=env_discrete.single_action_space)
     model_discrete = ActorCritic(
@@ -547,11 +695,11 @@ def test_deep_env_updater(loss_class):
     deep_model = Model(encoder=encoder, torso=torso, head=head)
     updater = DeepRegression(loss_class=loss_class)
 
-    observations = T.Tensor([1, 1])
-    actions = T.Tensor([1])
-    targets = T.Tensor([1, 1])
+    observations = T.tensor([1, 1], dtype=T.float32)
+    actions = T.tensor([1], dtype=T.float32)
+    targets = T.tensor([1, 1], dtype=T.float32)
     if isinstance(loss_class, T.nn.BCELoss):
-        targets = T.Tensor([False])
+        targets = T.tensor([False], dtype=T.float32)
     log = updater(deep_model, observations, actions, targets)
 
     if isinstance(loss_class, T.nn.MSELoss):